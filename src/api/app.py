@@ -1,7 +1,5 @@
 from litestar import Litestar
-from litestar.middleware.rate_limit import RateLimitConfig
 from litestar.openapi.config import OpenAPIConfig
-from litestar.stores.redis import RedisStore
 from loguru import logger
 
 from config import get_settings
@@ -14,17 +12,24 @@ from domain.exceptions import (
     CacheError,
 )
 from api.exceptions import exception_to_http_response
+from api.lifespan import (
+    close_cache_client,
+    close_http_client,
+    init_cache_client,
+    init_http_client,
+)
+from api.rate_limit import SlidingWindowRateLimitMiddleware
 from api.routes import CacheController
 
 
 def create_app() -> Litestar:
+    # get_settings is lru_cached, so this is a lookup, not a reparse; calling it here rather
+    # than at import keeps reset_settings() + create_app() working in tests
     settings = get_settings()
 
-    redis_store = RedisStore.with_client(url=settings.redis_url)
-
-    rate_limit_config = RateLimitConfig(
-        rate_limit=("minute", 10),
-        store="redis",
+    rate_limit_middleware = SlidingWindowRateLimitMiddleware(
+        limit=10,
+        window_seconds=60,
         exclude=["/schema"],
     )
 
@@ -45,15 +50,16 @@ def create_app() -> Litestar:
 
     app = Litestar(
         route_handlers=[CacheController],
-        stores={"redis": redis_store},
-        middleware=[rate_limit_config.middleware],
+        middleware=[rate_limit_middleware],
         exception_handlers=exception_handlers,
+        on_startup=[init_cache_client, init_http_client],
+        on_shutdown=[close_cache_client, close_http_client],
         debug=settings.log_level == "DEBUG",
         openapi_config=openapi_config,
     )
 
     logger.info("LiteStar application created")
-    logger.info(f"Redis URL: {settings.redis_url}")
+    logger.info("Redis URL: {}", settings.redis_url)
 
     return app
 
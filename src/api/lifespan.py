@@ -0,0 +1,40 @@
+from litestar import Litestar
+from loguru import logger
+
+from infrastructure.cache_redis import AsyncRedisCache
+from infrastructure.http_client import AsyncHTTPClient
+
+
+async def init_http_client(app: Litestar) -> None:
+    """Create the process-wide HTTP client so its connection pool is reused across requests."""
+    app.state.http_client = AsyncHTTPClient()
+
+
+async def close_http_client(app: Litestar) -> None:
+    client: AsyncHTTPClient | None = app.state.get("http_client")
+    if client:
+        await client.close()
+
+
+async def init_cache_client(app: Litestar) -> None:
+    """
+    Connect the process-wide Redis cache once at startup.
+
+    A failed connection disables caching for the lifetime of the app instead of failing startup.
+    """
+    client = AsyncRedisCache()
+
+    try:
+        await client.connect()
+        app.state.cache_client = client
+        app.state.cache_enabled = True
+    except Exception as e:
+        logger.warning("Failed to connect to Redis, caching disabled: {}", e)
+        app.state.cache_client = None
+        app.state.cache_enabled = False
+
+
+async def close_cache_client(app: Litestar) -> None:
+    client: AsyncRedisCache | None = app.state.get("cache_client")
+    if client:
+        await client.close()
@@ -0,0 +1,131 @@
+"""Sliding-window rate limiting backed by a single Redis Lua script."""
+
+import math
+import time
+import uuid
+from typing import TYPE_CHECKING, Optional
+
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.exceptions import TooManyRequestsException
+from litestar.middleware import ASGIMiddleware
+from loguru import logger
+
+if TYPE_CHECKING:
+    from litestar.types import ASGIApp, Message, Receive, Scope, Send
+    from redis.commands.core import AsyncScript
+
+    from infrastructure.cache_redis import AsyncRedisCache
+
+
+# Trims the window, counts it and records the hit in one atomic round-trip.
+# Returns {allowed (0/1), requests remaining, milliseconds until the oldest hit leaves the window}.
+SLIDING_WINDOW_SCRIPT = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+
+redis.call("ZREMRANGEBYSCORE", key, 0, now - window)
+
+local count = redis.call("ZCARD", key)
+local allowed = 0
+if count < limit then
+    redis.call("ZADD", key, now, ARGV[4])
+    redis.call("PEXPIRE", key, window)
+    count = count + 1
+    allowed = 1
+end
+
+local reset = window
+local oldest = redis.call("ZRANGE", key, 0, 0, "WITHSCORES")
+if oldest[2] then
+    reset = tonumber(oldest[2]) + window - now
+end
+return {allowed, math.max(limit - count, 0), reset}
+"""
+
+
+class SlidingWindowRateLimitMiddleware(ASGIMiddleware):
+    """
+    Limit requests per client IP using the shared Redis cache from app state.
+
+    Responses carry RateLimit-Policy/-Limit/-Remaining/-Reset headers, and denied requests
+    also get Retry-After. Requests are let through when the cache is unavailable, so Redis
+    outages degrade rate limiting instead of failing every request.
+    """
+
+    scopes = (ScopeType.HTTP,)
+    key_prefix = "ratelimit"
+
+    def __init__(
+        self,
+        limit: int = 10,
+        window_seconds: int = 60,
+        exclude: Optional[list[str]] = None,
+    ) -> None:
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.window_ms = window_seconds * 1000
+        self.exclude_path_pattern = tuple(exclude) if exclude else None
+        self._script: Optional["AsyncScript"] = None
+
+    async def handle(
+        self, scope: "Scope", receive: "Receive", send: "Send", next_app: "ASGIApp"
+    ) -> None:
+        cache: Optional["AsyncRedisCache"] = scope["litestar_app"].state.get("cache_client")
+
+        result = None
+        if cache is not None:
+            client = scope.get("client")
+            result = await self._check(cache, client[0] if client else "anonymous")
+
+        if result is None:
+            await next_app(scope, receive, send)
+            return
+
+        allowed, remaining, reset_ms = result
+        reset = max(1, math.ceil(reset_ms / 1000))
+        headers = {
+            "RateLimit-Policy": f"{self.limit}; w={self.window_seconds}",
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(reset),
+        }
+
+        if not allowed:
+            raise TooManyRequestsException(
+                detail="Rate limit exceeded",
+                headers={**headers, "Retry-After": str(reset)},
+            )
+
+        async def send_with_headers(message: "Message") -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableScopeHeaders.from_message(message=message)
+                for name, value in headers.items():
+                    response_headers.add(name, value)
+            await send(message)
+
+        await next_app(scope, receive, send_with_headers)
+
+    async def _check(
+        self, cache: "AsyncRedisCache", identifier: str
+    ) -> Optional[tuple[int, int, int]]:
+        """
+        Record a hit for identifier and return (allowed, remaining, reset in ms), or None
+        when Redis could not be reached.
+        """
+        now_ms = int(time.time() * 1000)
+        try:
+            if self._script is None:
+                self._script = cache.register_script(SLIDING_WINDOW_SCRIPT)
+
+            allowed, remaining, reset_ms = await self._script(
+                keys=[f"{self.key_prefix}:{identifier}"],
+                args=[now_ms, self.window_ms, self.limit, f"{now_ms}:{uuid.uuid4().hex}"],
+            )
+        except Exception as e:
+            logger.warning("Rate limit check failed, allowing request: {}", e)
+            return None
+
+        return allowed, remaining, reset_ms
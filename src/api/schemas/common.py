@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+import msgspec
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(msgspec.Struct, kw_only=True, frozen=True):
     status_code: int
     detail: str
     error_type: str
@@ -1,5 +1,6 @@
 """Configuration module for codeforces-editorial-finder."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -16,9 +17,30 @@ class Settings(BaseSettings):
         description="Cache TTL in hours",
     )
     redis_url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    redis_max_connections: int = Field(
+        default=20, description="Maximum connections in the shared Redis pool"
+    )
+    cache_l1_size: int = Field(
+        default=256, description="Max entries in the in-process cache in front of Redis (0 = off)"
+    )
+    cache_l1_ttl_seconds: int = Field(
+        default=300, description="TTL in seconds for entries in the in-process cache"
+    )
 
     # HTTP
     http_retries: int = Field(default=3, description="Number of HTTP retry attempts")
+    http_max_connections: int = Field(
+        default=20, description="Maximum concurrent connections in the shared HTTP session"
+    )
+    http_cache_size: int = Field(
+        default=128, description="Responses kept for conditional GET revalidation (0 disables)"
+    )
+    http_cache_ttl_seconds: int = Field(
+        default=600, description="How long a kept HTTP response may be reused or revalidated"
+    )
+    browser_max_pages: int = Field(
+        default=4, description="Maximum pages rendered at once by the shared headless browser"
+    )
     user_agent: str = Field(
         default="codeforces-editorial-finder/1.0", description="User agent for HTTP requests"
     )
@@ -33,6 +55,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     @field_validator("log_file")
@@ -54,19 +77,12 @@ class Settings(BaseSettings):
         return v_upper
 
 
-# Singleton instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get or create settings singleton instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reset_settings() -> None:
     """Reset settings singleton (useful for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
@@ -1,5 +1,7 @@
 """Custom exceptions for codeforces-editorial-finder."""
 
+from typing import Optional
+
 
 class CodeforcesEditorialError(Exception):
     """Base exception for all codeforces-editorial-finder errors."""
@@ -43,6 +45,26 @@ class NetworkError(CodeforcesEditorialError):
     pass
 
 
+class TransientNetworkError(NetworkError):
+    """Network failure worth retrying: server errors, timeouts, dropped connections."""
+
+    pass
+
+
+class PermanentNetworkError(NetworkError):
+    """Client error response (4xx) that will not succeed on retry."""
+
+    pass
+
+
+class RateLimitError(TransientNetworkError):
+    """HTTP 429 response; carries the server's Retry-After delay in seconds, if any."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class CacheError(CodeforcesEditorialError):
     """Cache operation error."""
 
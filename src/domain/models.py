@@ -1,9 +1,17 @@
 """Data models for codeforces-editorial-finder."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
+
+
+def _to_datetime(value: Union[float, str]) -> datetime:
+    """Read a serialized timestamp: epoch seconds, or ISO 8601 from older cache entries."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return datetime.fromtimestamp(value)
 
 
 class TutorialFormat(str, Enum):
@@ -22,7 +30,7 @@ class Language(str, Enum):
     AUTO = "auto"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class ProblemIdentifier:
     """Identifies a specific Codeforces problem."""
 
@@ -30,16 +38,46 @@ class ProblemIdentifier:
     problem_id: str
     is_gym: bool = False
 
+    # Derived values, built once in __post_init__ instead of on every access
+    _full_id: str = field(init=False, repr=False, compare=False)
+    _cache_key: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        prefix = "gym_" if self.is_gym else ""
+        object.__setattr__(self, "_full_id", f"{self.contest_id}{self.problem_id}")
+        object.__setattr__(
+            self, "_cache_key", f"editorial_{prefix}{self.contest_id}_{self.problem_id}"
+        )
+        object.__setattr__(self, "_hash", hash((self.contest_id, self.problem_id, self.is_gym)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ProblemIdentifier):
+            return NotImplemented
+        return (
+            self.contest_id == other.contest_id
+            and self.problem_id == other.problem_id
+            and self.is_gym == other.is_gym
+        )
+
+    def __reduce__(self):
+        # String hashes are salted per process; rebuild derived fields instead of pickling them
+        return (type(self), (self.contest_id, self.problem_id, self.is_gym))
+
     @property
     def full_id(self) -> str:
         """Get full problem identifier (e.g., '1234A')."""
-        return f"{self.contest_id}{self.problem_id}"
+        return self._full_id
 
     @property
     def cache_key(self) -> str:
         """Get cache key for this problem."""
-        prefix = "gym_" if self.is_gym else ""
-        return f"editorial_{prefix}{self.contest_id}_{self.problem_id}"
+        return self._cache_key
 
     def __str__(self) -> str:
         """String representation."""
@@ -47,7 +85,7 @@ class ProblemIdentifier:
         return f"{prefix}{self.contest_id}/{self.problem_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProblemData:
     """Data extracted from a problem page."""
 
@@ -63,7 +101,7 @@ class ProblemData:
     possible_editorial_links: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TutorialData:
     """Tutorial/editorial content and metadata."""
 
@@ -76,7 +114,7 @@ class TutorialData:
     raw_bytes: Optional[bytes] = None  # For PDF content
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeSnippet:
     """Code snippet from editorial."""
 
@@ -85,7 +123,7 @@ class CodeSnippet:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Editorial:
     """Extracted editorial/solution for a problem."""
 
@@ -95,7 +133,7 @@ class Editorial:
     extracted_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CachedEditorial:
     """Cached editorial with metadata."""
 
@@ -105,12 +143,18 @@ class CachedEditorial:
     tutorial_format: TutorialFormat
     cached_at: datetime = field(default_factory=datetime.now)
     ttl_hours: int = 168  # 7 days default
+    problem_data: Optional[ProblemData] = None  # Lets cache hits skip the problem page fetch
+
+    # Expiry as an epoch timestamp, computed once so is_expired is a single float compare
+    _expires_at: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_expires_at", self.cached_at.timestamp() + self.ttl_hours * 3600)
 
     @property
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
-        age_hours = (datetime.now() - self.cached_at).total_seconds() / 3600
-        return age_hours > self.ttl_hours
+        return time.time() > self._expires_at
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -124,12 +168,30 @@ class CachedEditorial:
                 "problem_id": self.editorial.problem_id,
                 "solution_text": self.editorial.solution_text,
                 "source_url": self.editorial.source_url,
-                "extracted_at": self.editorial.extracted_at.isoformat(),
+                "extracted_at": self.editorial.extracted_at.timestamp(),
             },
             "tutorial_url": self.tutorial_url,
             "tutorial_format": self.tutorial_format.value,
-            "cached_at": self.cached_at.isoformat(),
+            "cached_at": self.cached_at.timestamp(),
             "ttl_hours": self.ttl_hours,
+            "problem_data": self._problem_data_to_dict(),
+        }
+
+    def _problem_data_to_dict(self) -> Optional[dict]:
+        """Serialize problem data without its identifier (already stored under "problem")."""
+        if self.problem_data is None:
+            return None
+
+        return {
+            "title": self.problem_data.title,
+            "url": self.problem_data.url,
+            "contest_name": self.problem_data.contest_name,
+            "description": self.problem_data.description,
+            "time_limit": self.problem_data.time_limit,
+            "memory_limit": self.problem_data.memory_limit,
+            "tags": self.problem_data.tags,
+            "announcement_text": self.problem_data.announcement_text,
+            "possible_editorial_links": self.problem_data.possible_editorial_links,
         }
 
     @classmethod
@@ -145,14 +207,20 @@ class CachedEditorial:
             problem_id=data["editorial"]["problem_id"],
             solution_text=data["editorial"]["solution_text"],
             source_url=data["editorial"].get("source_url"),
-            extracted_at=datetime.fromisoformat(data["editorial"]["extracted_at"]),
+            extracted_at=_to_datetime(data["editorial"]["extracted_at"]),
         )
 
+        # Entries cached before problem data was stored don't have it
+        problem_data = None
+        if data.get("problem_data"):
+            problem_data = ProblemData(identifier=problem, **data["problem_data"])
+
         return cls(
             problem=problem,
             editorial=editorial,
             tutorial_url=data["tutorial_url"],
             tutorial_format=TutorialFormat(data["tutorial_format"]),
-            cached_at=datetime.fromisoformat(data["cached_at"]),
+            cached_at=_to_datetime(data["cached_at"]),
             ttl_hours=data["ttl_hours"],
+            problem_data=problem_data,
         )
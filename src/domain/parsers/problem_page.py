@@ -1,19 +1,134 @@
 """Parser for Codeforces problem pages."""
 
+import asyncio
 import re
-from typing import Optional, TYPE_CHECKING
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import ClassVar, Optional, TYPE_CHECKING
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
 from loguru import logger
 
 from domain.models import ProblemData, ProblemIdentifier
 from domain.exceptions import ParsingError
-from domain.parsers.url_parser import URLParser
+from domain.parsers.url_parser import URLParser, parse_problem_url
 
 if TYPE_CHECKING:
     from infrastructure.http_client import AsyncHTTPClient
 
 
+class _ProblemPageTarget:
+    """
+    lxml parser target that collects problem page fields while the HTML streams by.
+
+    No element tree is built: only the title, the breadcrumb links and each sidebox's
+    caption and hrefs are kept. Text is gathered per text node and stripped, matching
+    what a tree-based "".join(stripped texts) would produce.
+    """
+
+    def __init__(self):
+        self.title: Optional[str] = None
+        self.contest_name: Optional[str] = None
+        self.sideboxes: list[tuple[Optional[str], list[str]]] = []  # (caption, hrefs)
+
+        self._depth = 0
+        self._pending: list[str] = []
+
+        # Each open section records the depth it started at and the text it collects
+        self._title_depth: Optional[int] = None
+        self._title_parts: list[str] = []
+        self._seen_breadcrumbs = False
+        self._breadcrumbs_depth: Optional[int] = None
+        self._link_depth: Optional[int] = None
+        self._link_parts: list[str] = []
+        self._sidebox_depth: Optional[int] = None
+        self._sidebox_caption: Optional[str] = None
+        self._sidebox_hrefs: list[str] = []
+        self._caption_depth: Optional[int] = None
+        self._caption_parts: list[str] = []
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._flush()
+        self._depth += 1
+
+        if tag == "div":
+            classes = attrib.get("class", "").split()
+
+            if self.title is None and self._title_depth is None and "title" in classes:
+                self._title_depth = self._depth
+            if not self._seen_breadcrumbs and "breadcrumbs" in classes:
+                self._seen_breadcrumbs = True
+                self._breadcrumbs_depth = self._depth
+            if self._sidebox_depth is None and "sidebox" in classes:
+                self._sidebox_depth = self._depth
+            elif (
+                self._sidebox_depth is not None
+                and self._sidebox_caption is None
+                and self._caption_depth is None
+                and "caption" in classes
+            ):
+                self._caption_depth = self._depth
+
+        elif tag == "a":
+            if self._breadcrumbs_depth is not None and self._link_depth is None:
+                self._link_depth = self._depth
+            if self._sidebox_depth is not None and "href" in attrib:
+                self._sidebox_hrefs.append(attrib["href"])
+
+    def end(self, tag: str) -> None:
+        self._flush()
+
+        if self._title_depth == self._depth:
+            self.title = "".join(self._title_parts)
+            self._title_depth = None
+        if self._link_depth == self._depth:
+            # The last breadcrumb link is the contest
+            self.contest_name = "".join(self._link_parts)
+            self._link_parts = []
+            self._link_depth = None
+        if self._breadcrumbs_depth == self._depth:
+            self._breadcrumbs_depth = None
+        if self._caption_depth == self._depth:
+            self._sidebox_caption = "".join(self._caption_parts)
+            self._caption_parts = []
+            self._caption_depth = None
+        if self._sidebox_depth == self._depth:
+            self.sideboxes.append((self._sidebox_caption, self._sidebox_hrefs))
+            self._sidebox_caption = None
+            self._sidebox_hrefs = []
+            self._sidebox_depth = None
+
+        self._depth -= 1
+
+    def data(self, text: str) -> None:
+        self._pending.append(text)
+
+    def comment(self, text: str) -> None:
+        # Comments split text nodes but contribute no text
+        self._flush()
+
+    def close(self) -> "_ProblemPageTarget":
+        self._flush()
+        return self
+
+    def _flush(self) -> None:
+        """Hand the text node collected so far to every open section."""
+        if not self._pending:
+            return
+
+        text = "".join(self._pending).strip()
+        self._pending.clear()
+        if not text:
+            return
+
+        if self._title_depth is not None:
+            self._title_parts.append(text)
+        if self._link_depth is not None:
+            self._link_parts.append(text)
+        if self._caption_depth is not None:
+            self._caption_parts.append(text)
+
+
 class ProblemPageParser:
     """Parser for extracting data from Codeforces problem pages."""
 
@@ -21,6 +136,17 @@ class ProblemPageParser:
     MATERIALS_CAPTION_KEYWORD = "materials"
     RELEVANT_URL_SEGMENTS = ("/blog/", "/contest/")
     CODEFORCES_BASE_URL = "https://codeforces.com"
+    # Leading problem index in titles, e.g. "A. " or "B1. "
+    TITLE_PREFIX_PATTERN = re.compile(r"^[A-Z]\d*\.\s*")
+    # Root-relative, protocol-relative and plain-http prefixes, rewritten in one pass
+    URL_PREFIX_PATTERN = re.compile(r"^(?://|/|http://)")
+    URL_PREFIX_REPLACEMENTS: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "//": "https://",
+            "/": f"{CODEFORCES_BASE_URL}/",
+            "http://": "https://",
+        }
+    )
 
     def __init__(self, http_client: Optional["AsyncHTTPClient"] = None):
         """
@@ -36,120 +162,92 @@ class ProblemPageParser:
         Parse problem page and extract data.
         """
         url = URLParser.build_problem_url(identifier)
-        logger.info(f"Parsing problem page: {url}")
+        logger.info("Parsing problem page: {}", url)
 
         if not self.http_client:
             raise ParsingError(f"HTTP client not initialized for {url}")
 
         try:
-            html = await self.http_client.get_text(url)
-            soup = BeautifulSoup(html, "lxml")
+            html = await self.http_client.get_bytes(url)
 
-            # Extract minimal metadata
-            title = self._extract_title(soup)
-            contest_name = self._extract_contest_name(soup)
+            # Parsing is CPU-bound; keep it off the event loop
+            problem_data = await asyncio.to_thread(self._parse_html, html, identifier, url)
 
-            # Extract only the links from 'Contest materials'
-            editorial_links = self._extract_editorial_links(soup)
-
-            problem_data = ProblemData(
-                identifier=identifier,
-                title=title,
-                url=url,
-                contest_name=contest_name,
-                possible_editorial_links=editorial_links,
-            )
-
-            logger.info(f"Successfully parsed problem: {title}")
+            logger.info("Successfully parsed problem: {}", problem_data.title)
             return problem_data
 
         except Exception as e:
-            logger.error(f"Failed to parse problem page: {e}")
+            logger.error("Failed to parse problem page: {}", e)
             raise ParsingError(f"Failed to parse problem page {url}: {e}") from e
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract problem title."""
-        try:
-            # Try to find problem title in div.title
-            title_div = soup.find("div", class_="title")
-            if title_div:
-                # Remove problem ID (e.g., "A. " or "1234A. ")
-                title_text = title_div.get_text(strip=True)
-                # Remove leading problem identifier
-                title_text = re.sub(r"^[A-Z]\d*\.\s*", "", title_text)
-                return title_text
-
-            # Fallback: try header
-            header = soup.find("div", class_="header")
-            if header:
-                title_elem = header.find("div", class_="title")
-                if title_elem:
-                    title_text = title_elem.get_text(strip=True)
-                    title_text = re.sub(r"^[A-Z]\d*\.\s*", "", title_text)
-                    return title_text
+    def _parse_html(self, html: bytes, identifier: ProblemIdentifier, url: str) -> ProblemData:
+        """
+        Build ProblemData from the raw problem page in a single streaming pass.
 
-            return "Unknown Problem"
+        libxml2 decodes the bytes itself; Codeforces always serves UTF-8, and without an
+        explicit encoding libxml2 would fall back to Latin-1 for pages lacking a meta charset.
+        """
+        parser = etree.HTMLParser(target=_ProblemPageTarget(), encoding="utf-8")
+        target = etree.fromstring(html, parser)
 
-        except Exception as e:
-            logger.warning(f"Failed to extract title: {e}")
+        # Extract minimal metadata
+        title = self._extract_title(target.title)
+
+        # Extract only the links from 'Contest materials'
+        editorial_links = self._extract_editorial_links(target.sideboxes)
+
+        return ProblemData(
+            identifier=identifier,
+            title=title,
+            url=url,
+            contest_name=target.contest_name,
+            possible_editorial_links=editorial_links,
+        )
+
+    def _extract_title(self, title_text: Optional[str]) -> str:
+        """Extract problem title."""
+        # The first div.title is the problem title (it lives in the statement header)
+        if title_text is None:
             return "Unknown Problem"
 
-    def _extract_contest_name(self, soup: BeautifulSoup) -> Optional[str]:
-        """Extract contest name."""
-        try:
-            # Look for contest name in breadcrumbs or header
-            breadcrumbs = soup.find("div", class_="breadcrumbs")
-            if breadcrumbs:
-                links = breadcrumbs.find_all("a")
-                if len(links) > 0:
-                    # grab the last link
-                    return links[-1].get_text(strip=True)
-            return None
-        except Exception as e:
-            logger.warning(f"Failed to extract contest name: {e}")
-            return None
+        # Remove leading problem identifier (e.g., "A. " or "1234A. ")
+        return self.TITLE_PREFIX_PATTERN.sub("", title_text)
 
-    def _extract_editorial_links(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_editorial_links(
+        self, sideboxes: list[tuple[Optional[str], list[str]]]
+    ) -> list[str]:
         """Extract links from the Contest materials section."""
 
         links = []
-        # find all sidebar boxes
-        sideboxes = soup.find_all("div", class_="sidebox")
-
-        for box in sideboxes:
-            if self._is_materials_box(box):
-                box_links = self._extract_links_from_box(box)
-                links.extend(box_links)
+        for caption, hrefs in sideboxes:
+            if self._is_materials_box(caption):
+                links.extend(self._extract_links_from_box(hrefs))
 
         return links
 
-    def _is_materials_box(self, box: Tag) -> bool:
+    def _is_materials_box(self, caption: Optional[str]) -> bool:
         """Check if sidebar box contains contest materials"""
 
-        caption = box.find("div", class_="caption")
-        if not caption:
+        if caption is None:
             return False
 
-        return self.MATERIALS_CAPTION_KEYWORD in caption.get_text(strip=True).lower()
+        return self.MATERIALS_CAPTION_KEYWORD in caption.lower()
 
-    def _extract_links_from_box(self, box: Tag) -> list[str]:
+    def _extract_links_from_box(self, hrefs: list[str]) -> list[str]:
         """Extract links from sidebar box"""
 
         links = []
-        for link in box.find_all("a", href=True):
-            href = str(link["href"])
-
+        for href in hrefs:
             # Check if link contains any relevant path segment
             if any(segment in href for segment in self.RELEVANT_URL_SEGMENTS):
-                full_link = self._normalize_url(href=href)
-                links.append(full_link)
+                links.append(self._normalize_url(href=href))
         return links
 
     def _normalize_url(self, href: str) -> str:
-        """Ensure URL is absolute"""
-        if href.startswith("/"):
-            return f"{self.CODEFORCES_BASE_URL}{href}"
-        return href
+        """Ensure URL is absolute and uses https"""
+        return self.URL_PREFIX_PATTERN.sub(
+            lambda match: self.URL_PREFIX_REPLACEMENTS[match.group()], href, count=1
+        )
 
 
 async def parse_problem(url: str, http_client: Optional["AsyncHTTPClient"] = None) -> ProblemData:
@@ -163,8 +261,6 @@ async def parse_problem(url: str, http_client: Optional["AsyncHTTPClient"] = Non
     Returns:
         ProblemData
     """
-    from domain.parsers.url_parser import parse_problem_url
-
     identifier = parse_problem_url(url)
 
     parser = ProblemPageParser(http_client)
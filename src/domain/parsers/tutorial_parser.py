@@ -1,8 +1,12 @@
 """Parser for tutorial content (HTML and PDF)."""
 
-from bs4 import BeautifulSoup
+import io
+from typing import Optional
+from urllib.parse import urlparse
+
+import lxml.html
+from lxml import etree
 from loguru import logger
-import fitz  # PyMuPDF
 
 from domain.models import TutorialData, TutorialFormat, Language
 from domain.exceptions import ParsingError
@@ -11,6 +15,13 @@ from domain.exceptions import ParsingError
 class TutorialParser:
     """Parses tutorial content from HTML or PDF."""
 
+    # Page chrome dropped before extracting text
+    STRIPPED_TAGS = ("script", "style", "nav", "footer")
+    CONTENT_XPATH = etree.XPath(
+        "(//div[contains(concat(' ', normalize-space(@class), ' '), ' ttypography ')])[1]"
+    )
+    TITLE_XPATH = etree.XPath("(//h1)[1] | (//title)[1]")
+
     def __init__(self, http_client):
         """
         Initialize parser.
@@ -20,6 +31,20 @@ class TutorialParser:
         """
         self.http = http_client
 
+    @staticmethod
+    def _is_pdf_url(url: str) -> Optional[bool]:
+        """
+        Guess the tutorial format from the URL alone.
+
+        Returns None when the URL doesn't tell, so the caller can ask the server.
+        """
+        path = urlparse(url).path.lower()
+        if path.endswith(".pdf"):
+            return True
+        if "/blog/entry/" in path:
+            return False
+        return None
+
     async def parse(self, url: str) -> TutorialData:
         """
         Parse tutorial from URL.
@@ -33,20 +58,23 @@ class TutorialParser:
         Raises:
             ParsingError: If parsing fails
         """
-        logger.info(f"Parsing tutorial from: {url}")
+        logger.info("Parsing tutorial from: {}", url)
 
         try:
-            # Detect content type
-            content_type = await self.http.get_content_type(url)
-            logger.debug(f"Content type: {content_type}")
-
-            if "pdf" in content_type:
+            # Detect content type, skipping the extra request when the URL is conclusive
+            is_pdf = self._is_pdf_url(url)
+            if is_pdf is None:
+                content_type = await self.http.get_content_type(url)
+                logger.debug("Content type: {}", content_type)
+                is_pdf = "pdf" in content_type
+
+            if is_pdf:
                 return await self._parse_pdf(url)
             else:
                 return await self._parse_html(url)
 
         except Exception as e:
-            logger.error(f"Failed to parse tutorial: {e}")
+            logger.error("Failed to parse tutorial: {}", e)
             raise ParsingError(f"Failed to parse tutorial {url}: {e}") from e
 
     async def _parse_html(self, url: str) -> TutorialData:
@@ -57,30 +85,12 @@ class TutorialParser:
         # which may load content dynamically
         if "/blog/" in url or "/contest/" in url:
             wait_time = 5000  # Default JS wait time: 5000ms
-            logger.info(f"Using JS rendering for blog/contest page (wait: {wait_time}ms)")
+            logger.info("Using JS rendering for blog/contest page (wait: {}ms)", wait_time)
             html = await self.http.get_text_with_js(url, wait_time=wait_time)
         else:
             html = await self.http.get_text(url)
 
-        soup = BeautifulSoup(html, "lxml")
-
-        # Remove script and style tags
-        for tag in soup(["script", "style", "nav", "footer"]):
-            tag.decompose()
-
-        # Extract main content
-        content_div = soup.find("div", class_="ttypography") or soup.find("body")
-
-        if content_div:
-            content = content_div.get_text(separator="\n", strip=True)
-        else:
-            content = soup.get_text(separator="\n", strip=True)
-
-        # Try to extract title
-        title = None
-        title_elem = soup.find("h1") or soup.find("title")
-        if title_elem:
-            title = title_elem.get_text(strip=True)
+        content, title = self._extract_html_text(html)
 
         return TutorialData(
             url=url,
@@ -90,20 +100,60 @@ class TutorialParser:
             title=title,
         )
 
+    @classmethod
+    def _extract_html_text(cls, html: str) -> tuple[str, Optional[str]]:
+        """Extract the main text and title from an HTML page."""
+        # lxml rejects an empty document instead of returning an empty tree
+        if not html.strip():
+            return "", None
+
+        # Parse bytes so a leading <?xml ... encoding=...?> declaration isn't rejected
+        tree = lxml.html.fromstring(
+            html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+        )
+
+        # Remove script and style tags (their tail text stays in place)
+        etree.strip_elements(tree, *cls.STRIPPED_TAGS, with_tail=False)
+
+        # Extract main content
+        content_divs = cls.CONTENT_XPATH(tree)
+        root = tree.getroottree().getroot()
+        content_root = content_divs[0] if content_divs else root.find("body")
+        if content_root is None:
+            content_root = root
+
+        content = "\n".join(
+            stripped for text in content_root.itertext() if (stripped := text.strip())
+        )
+
+        # Try to extract title, preferring the first <h1> over <title>
+        title = None
+        title_elems = cls.TITLE_XPATH(tree)
+        if title_elems:
+            title_elem = next((e for e in title_elems if e.tag == "h1"), title_elems[0])
+            title = "".join(text.strip() for text in title_elem.itertext())
+
+        return content, title
+
     async def _parse_pdf(self, url: str) -> TutorialData:
         """Parse PDF tutorial."""
         logger.debug("Parsing as PDF")
 
+        # Imported lazily: PyMuPDF's native libraries are only needed for PDF tutorials
+        import fitz  # PyMuPDF
+
         pdf_bytes = await self.http.get_bytes(url)
 
-        # Extract text from PDF
-        text_content = []
+        # Extract text from PDF straight into one buffer instead of a list of page strings
+        buffer = io.StringIO()
 
         with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            for page in doc:
-                text_content.append(page.get_text())
+            for index, page in enumerate(doc):
+                if index:
+                    buffer.write("\n\n")
+                buffer.write(page.get_text("text"))
 
-        content = "\n\n".join(text_content)
+        content = buffer.getvalue()
 
         return TutorialData(
             url=url,
@@ -1,6 +1,7 @@
 """Parser for Codeforces problem URLs."""
 
 import re
+from typing import Optional
 from urllib.parse import urlparse
 
 from loguru import logger
@@ -13,23 +14,31 @@ class URLParser:
     """Parser for various Codeforces URL formats."""
 
     # Unified pattern matches: problemset/problem/1234/A
-    PATTERN = r"codeforces\.(?:com|ru)/problemset/problem/(\d+)/([A-Z]\d*)"
+    PATTERN = re.compile(r"codeforces\.(?:com|ru)/problemset/problem/(\d+)/([A-Z]\d*)")
+    # Same pattern anchored to an http(s) scheme and host; a match here is already a valid URL
+    ABSOLUTE_PATTERN = re.compile(
+        r"^https?://[^/?#]*codeforces\.(?:com|ru)/problemset/problem/(\d+)/([A-Z]\d*)"
+    )
 
     @classmethod
     def parse(cls, url: str) -> ProblemIdentifier:
         """
         Parse Codeforces problem URL and extract problem identifier.
         """
-        logger.debug(f"Parsing URL: {url}")
+        logger.debug("Parsing URL: {}", url)
 
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise URLParsingError(f"Invalid URL format: {url}")
-        except Exception as e:
-            raise URLParsingError(f"Failed to parse URL: {url}") from e
+        # Fast path for well-formed links; only fall back to urlparse for anything else
+        match = cls.ABSOLUTE_PATTERN.match(url)
+        if match is None:
+            try:
+                parsed = urlparse(url)
+                if not parsed.scheme or not parsed.netloc:
+                    raise URLParsingError(f"Invalid URL format: {url}")
+            except Exception as e:
+                raise URLParsingError(f"Failed to parse URL: {url}") from e
+
+            match = cls.PATTERN.search(url)
 
-        match = re.search(cls.PATTERN, url)
         if match:
             contest_id, problem_id = match.groups()
 
@@ -39,7 +48,7 @@ class URLParser:
                 is_gym=False,
             )
 
-            logger.info(f"Parsed URL to problem: {identifier}")
+            logger.info("Parsed URL to problem: {}", identifier)
             return identifier
 
         # No pattern matched
@@ -48,6 +57,21 @@ class URLParser:
             "Expected format: https://codeforces.com/problemset/problem/<contest_id>/<problem_id>"
         )
 
+    @classmethod
+    def parse_many(cls, urls: list[str]) -> list[Optional[ProblemIdentifier]]:
+        """
+        Parse a batch of URLs, returning an identifier or None for each one, in order.
+
+        Unrecognized URLs yield None instead of raising URLParsingError.
+        """
+        identifiers: list[Optional[ProblemIdentifier]] = []
+        for url in urls:
+            try:
+                identifiers.append(cls.parse(url))
+            except URLParsingError:
+                identifiers.append(None)
+        return identifiers
+
     @classmethod
     def build_problem_url(cls, identifier: ProblemIdentifier) -> str:
         """
@@ -56,7 +80,7 @@ class URLParser:
 
         url = f"https://codeforces.com/problemset/problem/{identifier.contest_id}/{identifier.problem_id}"
 
-        logger.debug(f"Built problem URL: {url}")
+        logger.debug("Built problem URL: {}", url)
         return url
 
     @classmethod
@@ -67,20 +91,26 @@ class URLParser:
 
         url = f"https://codeforces.com/contest/{identifier.contest_id}"
 
-        logger.debug(f"Built contest URL: {url}")
+        logger.debug("Built contest URL: {}", url)
         return url
 
     @classmethod
     def validate_url(cls, url: str) -> bool:
         """
         Check if URL is a valid Codeforces problem URL.
+
+        Accepts exactly what parse accepts, without building an identifier or raising.
         """
-        try:
-            cls.parse(url)
+        if cls.ABSOLUTE_PATTERN.match(url):
             return True
-        except URLParsingError:
+
+        try:
+            parsed = urlparse(url)
+        except ValueError:
             return False
 
+        return bool(parsed.scheme and parsed.netloc) and cls.PATTERN.search(url) is not None
+
 
 def parse_problem_url(url: str) -> ProblemIdentifier:
     """
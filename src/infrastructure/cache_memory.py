@@ -0,0 +1,59 @@
+"""In-process LRU cache used as a first tier in front of Redis."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class InMemoryLRUCache:
+    """
+    Bounded least-recently-used map with a per-entry TTL.
+
+    Values are stored as-is (already deserialized), so a hit costs no I/O or decoding.
+    The cache is local to the process; keep the TTL short so entries invalidated in
+    Redis by another worker don't linger here for long.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        ttl_seconds can shorten the entry's lifetime below the cache-wide TTL, never extend it.
+        """
+        if self.max_size <= 0:
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
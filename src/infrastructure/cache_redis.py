@@ -1,46 +1,79 @@
 """Async Redis client for caching Codeforces editorial data."""
 
-import json
-from typing import Optional
+from typing import Any, Optional
 
+import msgspec
 import redis.asyncio as redis
 from loguru import logger
+from redis.commands.core import AsyncScript
 
 from config import get_settings
 from domain.exceptions import CacheError
+from infrastructure.cache_memory import InMemoryLRUCache
 
 
 class AsyncRedisCache:
-    def __init__(self, redis_url: Optional[str] = None):
+    # Hash field holding the TTL an entry was stored with, so reads can refresh it as-is
+    TTL_FIELD = "__ttl__"
+    # Reads the hash and pushes its expiry back out to its own TTL in one round-trip
+    READ_SCRIPT = """
+local ttl = redis.call("HGET", KEYS[1], ARGV[1])
+if ttl then
+    redis.call("EXPIRE", KEYS[1], ttl)
+end
+return redis.call("HGETALL", KEYS[1])
+"""
+
+    def __init__(self, redis_url: Optional[str] = None, max_connections: Optional[int] = None):
         """
-        Initialize the cache client, using the configured Redis URL if none is provided.
+        Initialize the cache client, using the configured Redis URL and pool size if none
+        are provided.
+
+        Hot entries are also kept in an in-process LRU (L1) as their msgpack-encoded
+        fields, so repeated reads of the same key skip the Redis round-trip entirely.
+        Every hit decodes a fresh copy, so callers never share nested objects.
         """
         settings = get_settings()
         self.redis_url = redis_url or settings.redis_url
         self.ttl_seconds = settings.cache_ttl_hours * 3600
+        self.max_connections = max_connections or settings.redis_max_connections
+        self.local = InMemoryLRUCache(settings.cache_l1_size, settings.cache_l1_ttl_seconds)
 
+        self.pool: Optional[redis.BlockingConnectionPool] = None
         self.client: Optional[redis.Redis] = None
-        logger.debug(f"Initialized async Redis cache (URL: {self.redis_url})")
+        self._read_script: Optional[AsyncScript] = None
+        logger.debug("Initialized async Redis cache (URL: {})", self.redis_url)
 
     async def connect(self) -> None:
-        """Establish a Redis connection and verify it by issuing a ping."""
+        """
+        Create the connection pool and verify it by issuing a ping.
+
+        The pool is meant to be created once per process and shared by all requests;
+        callers block for a free connection instead of failing when it is exhausted.
+        """
         try:
-            self.client = await redis.from_url(
+            self.pool = redis.BlockingConnectionPool.from_url(
                 self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                max_connections=self.max_connections,
             )
+            self.client = redis.Redis(connection_pool=self.pool)
             # Test connection
             await self.client.ping()
-            logger.info("Successfully connected to Redis")
+            logger.info("Successfully connected to Redis (pool size: {})", self.max_connections)
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.error("Failed to connect to Redis: {}", e)
+            await self.close()
             raise CacheError(f"Failed to connect to Redis: {e}") from e
 
     async def close(self) -> None:
+        self._read_script = None
         if self.client:
-            await self.client.close()
-            logger.debug("Closed Redis connection")
+            await self.client.aclose()
+            self.client = None
+        if self.pool:
+            await self.pool.disconnect()
+            self.pool = None
+            logger.debug("Closed Redis connection pool")
 
     async def __aenter__(self):
         await self.connect()
@@ -51,30 +84,73 @@ class AsyncRedisCache:
 
     async def get(self, key: str) -> Optional[dict]:
         """
-        Retrieve a cached value and deserialize it from JSON.
+        Retrieve a cached hash and deserialize each of its fields from msgpack.
         Returns None on cache miss or read errors.
+
+        A hit also resets the key's TTL to the one it was stored with, so entries that keep
+        being requested stay cached while cold ones age out.
         """
 
         if not self.client:
             raise CacheError("Redis client not connected")
 
+        cached = self.local.get(key)
+        if cached is not None:
+            logger.debug("L1 cache hit for key: {}", key)
+            return self._decode_fields(cached)
+
         try:
-            data = await self.client.get(key)
+            if self._read_script is None:
+                self._read_script = self.register_script(self.READ_SCRIPT)
+
+            items = await self._read_script(keys=[key], args=[self.TTL_FIELD])
+
+            if not items:
+                logger.debug("Cache miss for key: {}", key)
+                return None
+
+            logger.debug("Cache hit for key: {}", key)
+            fields = {name.decode(): item for name, item in zip(items[::2], items[1::2])}
+            ttl = fields.pop(self.TTL_FIELD, None)
+            self.local.set(key, fields, int(ttl) if ttl is not None else None)
+            return self._decode_fields(fields)
+
+        except Exception as e:
+            logger.warning("Error reading from cache: {}", e)
+            return None
+
+    async def get_field(self, key: str, field: str) -> Optional[Any]:
+        """
+        Retrieve a single field of a cached hash without loading the rest of the entry.
+        Returns None if the key or field is missing, or on read errors.
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        cached = self.local.get(key)
+        if cached is not None:
+            data = cached.get(field)
+            return msgspec.msgpack.decode(data) if data is not None else None
+
+        try:
+            data = await self.client.hget(key, field)
 
             if data is None:
-                logger.debug(f"Cache miss for key: {key}")
+                logger.debug("Cache miss for key: {} (field: {})", key, field)
                 return None
 
-            logger.debug(f"Cache hit for key: {key}")
-            return json.loads(data)
+            logger.debug("Cache hit for key: {} (field: {})", key, field)
+            return msgspec.msgpack.decode(data)
 
         except Exception as e:
-            logger.warning(f"Error reading from cache: {e}")
+            logger.warning("Error reading from cache: {}", e)
             return None
 
     async def set(self, key: str, value: dict, ttl: Optional[int] = None) -> None:
         """
-        Store a dictionary in Redis as JSON, applying the default TTL if none is provided.
+        Store a dictionary in Redis as a hash with one msgpack-encoded field per top-level
+        key, applying the default TTL if none is provided. The TTL is kept alongside in
+        TTL_FIELD so reads refresh the entry to it rather than to the default.
         """
         if not self.client:
             raise CacheError("Redis client not connected")
@@ -82,36 +158,62 @@ class AsyncRedisCache:
         ttl = ttl or self.ttl_seconds
 
         try:
-            data = json.dumps(value)
-            await self.client.setex(key, ttl, data)
-            logger.debug(f"Cached data for key: {key} (TTL: {ttl}s)")
+            fields = {name: msgspec.msgpack.encode(item) for name, item in value.items()}
+            # MULTI/EXEC so readers never see the hash between DEL and HSET
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping={**fields, self.TTL_FIELD: str(ttl)})
+                pipe.expire(key, ttl)
+                await pipe.execute()
+            self.local.set(key, fields, ttl)
+            logger.debug("Cached data for key: {} (TTL: {}s)", key, ttl)
 
         except Exception as e:
-            logger.error(f"Failed to cache data: {e}")
+            logger.error("Failed to cache data: {}", e)
             raise CacheError(f"Failed to cache data: {e}") from e
 
+    @staticmethod
+    def _decode_fields(fields: dict[str, bytes]) -> dict:
+        """Decode each msgpack-encoded field of a cached hash."""
+        return {name: msgspec.msgpack.decode(item) for name, item in fields.items()}
+
+    def register_script(self, script: str) -> AsyncScript:
+        """
+        Register a Lua script on the shared client.
+
+        Calls run through EVALSHA, loading the script into Redis on first use.
+        """
+        if not self.client:
+            raise CacheError("Redis client not connected")
+
+        return self.client.register_script(script)
+
     async def delete(self, key: str) -> None:
         if not self.client:
             raise CacheError("Redis client not connected")
 
+        self.local.delete(key)
+
         try:
             await self.client.delete(key)
-            logger.debug(f"Deleted cache entry: {key}")
+            logger.debug("Deleted cache entry: {}", key)
 
         except Exception as e:
-            logger.warning(f"Error deleting cache entry: {e}")
+            logger.warning("Error deleting cache entry: {}", e)
 
     async def flushdb(self) -> None:
         """Clear all cache (flushes current database)."""
         if not self.client:
             raise CacheError("Redis client not connected")
 
+        self.local.clear()
+
         try:
             await self.client.flushdb()
             logger.info("Flushed Redis database")
 
         except Exception as e:
-            logger.error(f"Failed to flush cache: {e}")
+            logger.error("Failed to flush cache: {}", e)
             raise CacheError(f"Failed to flush cache: {e}") from e
 
     async def exists(self, key: str) -> bool:
@@ -124,5 +226,5 @@ class AsyncRedisCache:
         try:
             return await self.client.exists(key) > 0
         except Exception as e:
-            logger.warning(f"Error checking key existence: {e}")
+            logger.warning("Error checking key existence: {}", e)
             return False
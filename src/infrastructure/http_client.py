@@ -1,31 +1,93 @@
 """Async HTTP client with retry logic for fetching web content."""
 
-from typing import Optional
+import asyncio
+import random
+import re
+import time
+from dataclasses import dataclass
+from email.utils import mktime_tz, parsedate_tz
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional
 
 from curl_cffi.requests import AsyncSession
 from loguru import logger
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from config import get_settings
-from domain.exceptions import NetworkError, ProblemNotFoundError
+from domain.exceptions import (
+    NetworkError,
+    PermanentNetworkError,
+    ProblemNotFoundError,
+    RateLimitError,
+    TransientNetworkError,
+)
+from infrastructure.cache_memory import InMemoryLRUCache
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Playwright, Route
+
+
+@dataclass(slots=True, frozen=True)
+class CachedResponse:
+    """
+    The parts of an HTML response kept for reuse: status, validators and decoded body.
+
+    Exposes the same text/content/headers attributes callers read from a live response.
+    """
+
+    status_code: int
+    headers: dict[str, str]  # content-type, etag and last-modified only (lowercase names)
+    text: str
+
+    @property
+    def content(self) -> bytes:
+        return self.text.encode("utf-8")
 
 
 class AsyncHTTPClient:
-    def __init__(self, timeout: Optional[int] = None, user_agent: Optional[str] = None):
+    MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+    # Backoff between retries, in seconds; jitter keeps concurrent clients from retrying in step
+    RETRY_MIN_DELAY = 2
+    RETRY_MAX_DELAY = 10
+    RETRY_JITTER = 1
+    # Only HTML bodies up to this size are kept for reuse; PDFs and other binaries never are
+    CACHE_MAX_BODY_BYTES = 512 * 1024
+    CACHED_HEADERS = ("content-type", "etag", "last-modified")
+    # Resources JS-rendered fetches never need; skipping them cuts most of a page's bytes
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+    def __init__(
+        self,
+        timeout: Optional[int] = None,
+        user_agent: Optional[str] = None,
+        max_connections: Optional[int] = None,
+    ):
         """
-        Initialize the client, falling back to configured timeout and user-agent when not provided.
+        Initialize the client, falling back to configured timeout, user-agent and pool size
+        when not provided.
+
+        The underlying session keeps connections alive, so one instance should be shared
+        for the lifetime of the process rather than created per request. Small HTML responses
+        that are fresh or carry an ETag/Last-Modified header are kept for HTTP_CACHE_TTL_SECONDS
+        so later fetches can reuse or revalidate them.
         """
         settings = get_settings()
         self.timeout = timeout or 30  # Default timeout: 30 seconds
         self.user_agent = user_agent or settings.user_agent
         self.retries = settings.http_retries
+        self.max_connections = max_connections or settings.http_max_connections
 
         # HTTP client using curl_cffi with browser impersonation
-        self.client = AsyncSession()
+        self.client = AsyncSession(max_clients=self.max_connections)
+        # Headless browser for JS-rendered pages, started on first use and shared
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        self._browser_lock = asyncio.Lock()
+        self._browser_pages = asyncio.Semaphore(max(1, settings.browser_max_pages))
+        self.responses = InMemoryLRUCache(settings.http_cache_size, settings.http_cache_ttl_seconds)
+        self.content_types = InMemoryLRUCache(
+            settings.http_cache_size, settings.http_cache_ttl_seconds
+        )
+        # GETs currently on the wire, keyed by URL
+        self._inflight: dict[str, asyncio.Task] = {}
 
     async def __aenter__(self):
         return self
@@ -36,38 +98,101 @@ class AsyncHTTPClient:
     async def close(self) -> None:
         await self.client.close()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
     async def get(self, url: str):
         """
         Fetch a URL using curl_cffi with automatic retries and domain-specific error mapping.
 
-        404 responses raise ProblemNotFoundError; other HTTP failures raise NetworkError.
+        Responses still fresh per Cache-Control/Expires are served without a request; stale
+        ones are revalidated with a conditional GET and reused on 304. Concurrent calls for
+        the same URL wait on a single request.
+        404 responses raise ProblemNotFoundError and other client errors PermanentNetworkError
+        right away; server errors, timeouts and 408/429 are retried with exponential backoff
+        and raise TransientNetworkError once retries run out.
+        """
+        logger.debug("Fetching URL: {}", url)
+
+        entry = self.responses.get(url)
+        cached = None
+        if entry is not None:
+            fresh_until, cached = entry
+            if fresh_until > time.time():
+                logger.debug("Serving fresh cached response: {}", url)
+                return cached
+
+        # Concurrent callers for the same URL share one request
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._with_retries(url, lambda: self._fetch(url, cached)))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        else:
+            logger.debug("Joining in-flight request: {}", url)
+
+        # Shielded so one caller being cancelled does not cancel the others' request
+        return await asyncio.shield(task)
+
+    async def _with_retries(self, url: str, request: Callable[[], Awaitable]):
+        """
+        Run request, retrying TransientNetworkError with jittered exponential backoff.
+
+        A 429 waits out the server's Retry-After instead; one longer than RETRY_MAX_DELAY
+        is not worth waiting for and fails right away.
         """
-        logger.debug(f"Fetching URL: {url}")
+        attempts = max(1, self.retries)
+        delay = self.RETRY_MIN_DELAY
+        for attempt in range(1, attempts + 1):
+            try:
+                return await request()
+            except TransientNetworkError as e:
+                retry_after = e.retry_after if isinstance(e, RateLimitError) else None
+                if attempt == attempts or (
+                    retry_after is not None and retry_after > self.RETRY_MAX_DELAY
+                ):
+                    raise
+
+                wait = retry_after
+                if wait is None:
+                    wait = delay + random.uniform(0, self.RETRY_JITTER)
+                    delay = min(delay * 2, self.RETRY_MAX_DELAY)
+
+                logger.warning(
+                    "Attempt {}/{} failed for {}: {}; retrying in {:.1f}s",
+                    attempt,
+                    attempts,
+                    url,
+                    e,
+                    wait,
+                )
+                await asyncio.sleep(wait)
 
+    async def _fetch(self, url: str, cached):
+        """Issue a single GET, mapping failures to domain errors."""
         try:
             # Use curl_cffi with Chrome 120 impersonation to bypass TLS fingerprinting
             response = await self.client.get(
                 url,
+                headers=self._conditional_headers(cached),
                 timeout=self.timeout,
                 impersonate="chrome120",
                 allow_redirects=True,
             )
 
-            # Check status code
-            if response.status_code == 404:
-                logger.error(f"Resource not found: {url}")
-                raise ProblemNotFoundError(f"Resource not found: {url}")
+            if response.status_code == 304 and cached is not None:
+                logger.debug("Not modified, reusing cached response: {}", url)
+                self._store_response(url, cached, response.headers)
+                return cached
 
-            if response.status_code >= 400:
-                logger.error(f"HTTP error {response.status_code} for {url}")
-                raise NetworkError(f"HTTP error {response.status_code}: {url}")
+            self._check_status(url, response)
+            self._store_response(url, response, response.headers)
 
-            logger.debug(f"Successfully fetched URL: {url} (status: {response.status_code})")
+            logger.debug("Successfully fetched URL: {} (status: {})", url, response.status_code)
             return response
 
         except ProblemNotFoundError:
@@ -75,8 +200,163 @@ class AsyncHTTPClient:
         except NetworkError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error fetching {url}: {e}")
-            raise NetworkError(f"Failed to fetch {url}: {e}") from e
+            logger.error("Unexpected error fetching {}: {}", url, e)
+            raise TransientNetworkError(f"Failed to fetch {url}: {e}") from e
+
+    async def _fetch_headers(self, url: str):
+        """
+        Issue a single HEAD, mapping failures to domain errors.
+
+        Servers that reject HEAD get a streamed GET for the first byte only, closed as soon
+        as its headers are in, so the body is never read either way.
+        """
+        try:
+            response = await self.client.head(
+                url, timeout=self.timeout, impersonate="chrome120", allow_redirects=True
+            )
+            if response.status_code in (405, 501):
+                logger.debug("HEAD not allowed, falling back to ranged GET: {}", url)
+                response = await self.client.get(
+                    url,
+                    headers={"Range": "bytes=0-0"},
+                    timeout=self.timeout,
+                    impersonate="chrome120",
+                    allow_redirects=True,
+                    stream=True,
+                )
+                # Servers may ignore Range; closing stops a full body from being streamed
+                await response.aclose()
+
+            self._check_status(url, response)
+            return response
+
+        except ProblemNotFoundError:
+            raise
+        except NetworkError:
+            raise
+        except Exception as e:
+            logger.error("Unexpected error fetching headers for {}: {}", url, e)
+            raise TransientNetworkError(f"Failed to fetch headers for {url}: {e}") from e
+
+    @classmethod
+    def _check_status(cls, url: str, response) -> None:
+        """
+        Map an HTTP failure to a domain error.
+
+        404 raises ProblemNotFoundError, 408, 429 and 5xx TransientNetworkError (429 as
+        RateLimitError), and any other 4xx PermanentNetworkError.
+        """
+        if response.status_code == 404:
+            logger.error("Resource not found: {}", url)
+            raise ProblemNotFoundError(f"Resource not found: {url}")
+
+        if response.status_code == 429:
+            logger.error("Rate limited by {}", url)
+            raise RateLimitError(
+                f"HTTP error 429: {url}",
+                retry_after=cls._retry_after(response.headers),
+            )
+
+        if response.status_code >= 500 or response.status_code == 408:
+            logger.error("HTTP error {} for {}", response.status_code, url)
+            raise TransientNetworkError(f"HTTP error {response.status_code}: {url}")
+
+        if response.status_code >= 400:
+            logger.error("HTTP error {} for {}", response.status_code, url)
+            raise PermanentNetworkError(f"HTTP error {response.status_code}: {url}")
+
+    async def get_many(self, urls: list[str]) -> list:
+        """
+        Fetch several URLs concurrently over the shared session.
+
+        Responses are returned in the order of urls; the first failure is raised.
+        """
+        return await asyncio.gather(*(self.get(url) for url in urls))
+
+    def _store_response(self, url: str, response, headers) -> None:
+        """
+        Keep a response for later reuse when it is either fresh for a while or revalidatable.
+
+        headers carry the caching directives; on a 304 they come from the revalidation
+        response rather than the stored one.
+        """
+        if "no-store" in headers.get("cache-control", "").lower():
+            return
+
+        if not isinstance(response, CachedResponse):
+            response = self._to_cached(response)
+            if response is None:
+                return
+
+        fresh_until = time.time() + self._freshness_lifetime(headers)
+        revalidatable = "etag" in response.headers or "last-modified" in response.headers
+        if fresh_until > time.time() or revalidatable:
+            self.responses.set(url, (fresh_until, response))
+
+    @classmethod
+    def _to_cached(cls, response) -> Optional[CachedResponse]:
+        """Reduce a response to what reuse needs, or None if its body is not small HTML."""
+        if not response.headers.get("content-type", "").lower().startswith("text/html"):
+            return None
+        if len(response.content) > cls.CACHE_MAX_BODY_BYTES:
+            return None
+
+        headers = {
+            name: value for name in cls.CACHED_HEADERS if (value := response.headers.get(name))
+        }
+        return CachedResponse(status_code=response.status_code, headers=headers, text=response.text)
+
+    @classmethod
+    def _freshness_lifetime(cls, headers) -> float:
+        """
+        Seconds a response stays fresh, from Cache-Control max-age or else Expires.
+
+        Time the response already spent in upstream caches (the Age header) is subtracted.
+        """
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control:
+            return 0
+
+        if match := cls.MAX_AGE_PATTERN.search(cache_control):
+            lifetime = float(match.group(1))
+        else:
+            expires = parsedate_tz(headers.get("expires", ""))
+            if expires is None:
+                return 0
+
+            date = parsedate_tz(headers.get("date", ""))
+            now = mktime_tz(date) if date else time.time()
+            lifetime = mktime_tz(expires) - now
+
+        age = headers.get("age", "").strip()
+        if age.isdigit():
+            lifetime -= int(age)
+        return max(0.0, lifetime)
+
+    @staticmethod
+    def _retry_after(headers) -> Optional[float]:
+        """Seconds to wait per a Retry-After header, given either as seconds or an HTTP date."""
+        value = headers.get("retry-after", "").strip()
+        if value.isdigit():
+            return float(value)
+
+        retry_at = parsedate_tz(value)
+        if retry_at is None:
+            return None
+        return max(0.0, mktime_tz(retry_at) - time.time())
+
+    @staticmethod
+    def _conditional_headers(cached) -> Optional[dict[str, str]]:
+        """Build If-None-Match / If-Modified-Since headers from a cached response."""
+        if cached is None:
+            return None
+
+        headers = {}
+        if etag := cached.headers.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := cached.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers or None
 
     async def get_text(self, url: str) -> str:
         """
@@ -90,39 +370,84 @@ class AsyncHTTPClient:
         return response.content
 
     async def get_content_type(self, url: str) -> str:
-        response = await self.get(url)
-        return response.headers.get("content-type", "").lower()
+        """
+        Return the Content-Type of a URL without downloading its body.
+
+        A cached response answers directly; otherwise the headers are fetched with HEAD
+        and the result is remembered per URL.
+        """
+        content_type = self.content_types.get(url)
+        if content_type is not None:
+            return content_type
+
+        entry = self.responses.get(url)
+        if entry is not None:
+            headers = entry[1].headers
+        else:
+            response = await self._with_retries(url, lambda: self._fetch_headers(url))
+            headers = response.headers
+
+        content_type = headers.get("content-type", "").lower()
+        self.content_types.set(url, content_type)
+        return content_type
 
     async def get_text_with_js(self, url: str, wait_time: int = 3000) -> str:
         """
         Fetch a page using a headless browser to allow JavaScript-rendered content to load.
         Use this for sites that populate data dynamically via JS.
         """
-        logger.info(f"Fetching URL with JS rendering: {url} (wait: {wait_time}ms)")
+        logger.info("Fetching URL with JS rendering: {} (wait: {}ms)", url, wait_time)
 
         try:
-            from playwright.async_api import async_playwright
-
-            async with async_playwright() as p:
-                # Launch browser in headless mode
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page(user_agent=self.user_agent)
+            browser = await self._get_browser()
 
-                # Navigate to page
-                await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout * 1000)
+            # Cap open pages so a burst of JS fetches cannot exhaust the browser's memory
+            async with self._browser_pages:
+                # A fresh context per call keeps cookies and storage isolated between pages
+                context = await browser.new_context(user_agent=self.user_agent)
+                try:
+                    await context.route("**/*", self._route_resource)
+                    page = await context.new_page()
 
-                # Wait for dynamic content to load
-                await page.wait_for_timeout(wait_time)
+                    # Navigate to page
+                    await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout * 1000)
 
-                # Get rendered HTML
-                content = await page.content()
+                    # Wait for dynamic content to load
+                    await page.wait_for_timeout(wait_time)
 
-                # Cleanup
-                await browser.close()
+                    # Get rendered HTML
+                    content = await page.content()
+                finally:
+                    await context.close()
 
-                logger.info(f"Successfully fetched URL with JS: {url} ({len(content)} chars)")
-                return content
+            logger.info("Successfully fetched URL with JS: {} ({} chars)", url, len(content))
+            return content
 
         except Exception as e:
-            logger.error(f"Failed to fetch URL with JS rendering: {url} - {e}")
+            logger.error("Failed to fetch URL with JS rendering: {} - {}", url, e)
             raise NetworkError(f"Failed to fetch {url} with JS rendering: {e}") from e
+
+    async def _route_resource(self, route: "Route") -> None:
+        """Abort requests for images, fonts and media; let everything else through."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _get_browser(self) -> "Browser":
+        """
+        Return the shared headless browser, launching it on first use.
+
+        Launching Chromium takes seconds, so it is done once per client and reused by every
+        JS-rendered fetch; a browser that has crashed or disconnected is relaunched.
+        """
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+                logger.info("Launched headless browser for JS rendering")
+
+            return self._browser
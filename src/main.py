@@ -1,4 +1,14 @@
+import sys
+
 import uvicorn
 
 if __name__ == "__main__":
-    uvicorn.run("api.app:app", host="0.0.0.0", port=8000, factory=False)
+    # uvloop and httptools come with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        "api.app:app",
+        host="0.0.0.0",
+        port=8000,
+        factory=False,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
@@ -0,0 +1,42 @@
+import time
+
+from infrastructure.cache_memory import InMemoryLRUCache
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = InMemoryLRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", {"value": 1})
+    cache.set("b", {"value": 2})
+
+    assert cache.get("a") == {"value": 1}
+
+    cache.set("c", {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("c") == {"value": 3}
+    assert len(cache) == 2
+
+
+def test_expired_entries_are_misses() -> None:
+    cache = InMemoryLRUCache(max_size=2, ttl_seconds=0)
+    cache.set("a", {"value": 1})
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_zero_size_disables_cache() -> None:
+    cache = InMemoryLRUCache(max_size=0, ttl_seconds=60)
+    cache.set("a", {"value": 1})
+
+    assert cache.get("a") is None
+
+
+def test_entry_ttl_only_shortens_cache_ttl() -> None:
+    cache = InMemoryLRUCache(max_size=2, ttl_seconds=60)
+    cache.set("a", {"value": 1}, ttl_seconds=0)
+    cache.set("b", {"value": 2}, ttl_seconds=3600)
+
+    assert cache.get("a") is None
+    assert cache._entries["b"][0] - time.monotonic() <= 60
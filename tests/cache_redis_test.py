@@ -0,0 +1,101 @@
+import time
+
+import fakeredis
+import pytest
+
+from infrastructure.cache_redis import AsyncRedisCache
+
+
+@pytest.fixture
+def cache() -> AsyncRedisCache:
+    redis_cache = AsyncRedisCache()
+    redis_cache.client = fakeredis.FakeAsyncRedis()
+    return redis_cache
+
+
+@pytest.mark.asyncio
+async def test_get_keeps_explicit_ttl(cache) -> None:
+    await cache.set("key", {"value": 1}, ttl=30)
+    cache.local.clear()
+
+    assert await cache.get("key") == {"value": 1}
+    assert 0 < await cache.client.ttl("key") <= 30
+
+
+@pytest.mark.asyncio
+async def test_get_refreshes_default_ttl(cache) -> None:
+    await cache.set("key", {"value": 1})
+    await cache.client.expire("key", 10)
+    cache.local.clear()
+
+    await cache.get("key")
+
+    assert await cache.client.ttl("key") > 10
+
+
+@pytest.mark.asyncio
+async def test_local_entry_never_outlives_redis_ttl(cache) -> None:
+    await cache.set("key", {"value": 1}, ttl=5)
+
+    expires_at, _ = cache.local._entries["key"]
+    assert expires_at - time.monotonic() <= 5
+
+
+@pytest.mark.asyncio
+async def test_set_stores_one_msgpack_field_per_key(cache) -> None:
+    await cache.set("key", {"title": "A", "tags": ["dp"]}, ttl=60)
+
+    stored = await cache.client.hgetall("key")
+
+    assert set(stored) == {b"title", b"tags", cache.TTL_FIELD.encode()}
+    assert await cache.get_field("key", "tags") == ["dp"]
+    cache.local.clear()
+    assert await cache.get_field("key", "tags") == ["dp"]
+    assert await cache.get_field("key", "missing") is None
+
+
+@pytest.mark.asyncio
+async def test_get_reads_hash_back(cache) -> None:
+    await cache.set("key", {"title": "A", "tags": ["dp"]})
+    cache.local.clear()
+
+    assert await cache.get("key") == {"title": "A", "tags": ["dp"]}
+    assert await cache.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_local_entry_is_not_shared_with_callers(cache) -> None:
+    value = {"title": "A"}
+    await cache.set("key", value)
+    value["title"] = "changed"
+
+    first = await cache.get("key")
+    first["title"] = "mutated"
+
+    assert await cache.get("key") == {"title": "A"}
+
+
+@pytest.mark.asyncio
+async def test_nested_values_are_not_shared_with_callers(cache) -> None:
+    value = {"problem": {"tags": ["dp"]}}
+    await cache.set("key", value)
+    value["problem"]["tags"].append("set")
+
+    (await cache.get("key"))["problem"]["tags"].append("get")
+    (await cache.get_field("key", "problem"))["tags"].append("get_field")
+
+    assert await cache.get("key") == {"problem": {"tags": ["dp"]}}
+    assert await cache.get_field("key", "problem") == {"tags": ["dp"]}
+
+
+@pytest.mark.asyncio
+async def test_delete_and_flushdb_clear_local_entries(cache) -> None:
+    await cache.set("a", {"value": 1})
+    await cache.set("b", {"value": 2})
+
+    await cache.delete("a")
+    assert await cache.get("a") is None
+
+    await cache.flushdb()
+    assert len(cache.local) == 0
+    assert await cache.get("b") is None
@@ -0,0 +1,230 @@
+import pytest
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from domain.exceptions import (
+    NetworkError,
+    PermanentNetworkError,
+    ProblemNotFoundError,
+    RateLimitError,
+)
+from infrastructure.http_client import AsyncHTTPClient
+
+
+def make_response(status_code: int, headers: dict | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        status_code=status_code, headers=headers or {}, text="body", content=b"body"
+    )
+
+
+@pytest.fixture
+def client() -> AsyncHTTPClient:
+    http_client = AsyncHTTPClient()
+    http_client.retries = 3
+    http_client.client.get = AsyncMock()
+    http_client.client.head = AsyncMock()
+    return http_client
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_errors(client) -> None:
+    ok = make_response(200)
+    client.client.get.side_effect = [make_response(500), make_response(502), ok]
+
+    with (
+        patch("infrastructure.http_client.asyncio.sleep", new=AsyncMock()) as sleep,
+        patch("infrastructure.http_client.random.uniform", return_value=0.5),
+    ):
+        response = await client.get("https://codeforces.com/blog/entry/1")
+
+    assert response is ok
+    assert [call.args[0] for call in sleep.await_args_list] == [2.5, 4.5]
+
+
+@pytest.mark.asyncio
+async def test_get_raises_after_last_attempt(client) -> None:
+    client.client.get.side_effect = [make_response(500)] * 3
+
+    with patch("infrastructure.http_client.asyncio.sleep", new=AsyncMock()):
+        with pytest.raises(NetworkError):
+            await client.get("https://codeforces.com/blog/entry/1")
+
+    assert client.client.get.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_retry_not_found(client) -> None:
+    client.client.get.side_effect = [make_response(404)]
+
+    with pytest.raises(ProblemNotFoundError):
+        await client.get("https://codeforces.com/problemset/problem/1/Z")
+
+    assert client.client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_retry_client_errors(client) -> None:
+    client.client.get.side_effect = [make_response(403)]
+
+    with pytest.raises(PermanentNetworkError):
+        await client.get("https://codeforces.com/blog/entry/1")
+
+    assert client.client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_waits_out_retry_after(client) -> None:
+    ok = make_response(200)
+    client.client.get.side_effect = [make_response(429, {"retry-after": "3"}), ok]
+
+    with patch("infrastructure.http_client.asyncio.sleep", new=AsyncMock()) as sleep:
+        response = await client.get("https://codeforces.com/blog/entry/1")
+
+    assert response is ok
+    sleep.assert_awaited_once_with(3.0)
+
+
+@pytest.mark.asyncio
+async def test_get_gives_up_on_long_retry_after(client) -> None:
+    client.client.get.side_effect = [make_response(429, {"retry-after": "120"})]
+
+    with pytest.raises(RateLimitError):
+        await client.get("https://codeforces.com/blog/entry/1")
+
+    assert client.client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_revalidates_and_reuses_body_on_304(client) -> None:
+    validators = {"etag": '"v1"', "last-modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    client.client.get.side_effect = [
+        make_response(200, {"content-type": "text/html; charset=utf-8", **validators}),
+        make_response(304),
+    ]
+    url = "https://codeforces.com/blog/entry/1"
+
+    await client.get(url)
+    response = await client.get(url)
+
+    assert client.client.get.await_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert response.text == "body"
+    assert response.content == b"body"
+    assert response.headers == {"content-type": "text/html; charset=utf-8", **validators}
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_keep_binary_bodies(client) -> None:
+    client.client.get.return_value = make_response(
+        200, {"content-type": "application/pdf", "etag": '"v1"'}
+    )
+    url = "https://codeforces.com/contest/1/attachments/download/1/editorial.pdf"
+
+    await client.get(url)
+    await client.get(url)
+
+    assert client.client.get.await_args.kwargs["headers"] is None
+    assert len(client.responses) == 0
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        ({"cache-control": "public, max-age=60"}, 60),
+        ({"cache-control": "max-age=60", "age": "45"}, 15),
+        ({"cache-control": "max-age=60", "age": "90"}, 0),
+        ({"cache-control": "no-cache, max-age=60"}, 0),
+        (
+            {
+                "date": "Wed, 01 Jan 2025 00:00:00 GMT",
+                "expires": "Wed, 01 Jan 2025 00:02:00 GMT",
+            },
+            120,
+        ),
+        ({}, 0),
+    ],
+)
+def test_freshness_lifetime(headers, expected) -> None:
+    assert AsyncHTTPClient._freshness_lifetime(headers) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_serves_fresh_response_without_request(client) -> None:
+    client.client.get.return_value = make_response(
+        200, {"content-type": "text/html", "cache-control": "max-age=60"}
+    )
+    url = "https://codeforces.com/blog/entry/1"
+
+    await client.get(url)
+    response = await client.get(url)
+
+    assert response.text == "body"
+    assert client.client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_does_not_keep_no_store_responses(client) -> None:
+    client.client.get.return_value = make_response(
+        200, {"content-type": "text/html", "cache-control": "no-store, max-age=60", "etag": "x"}
+    )
+    url = "https://codeforces.com/blog/entry/1"
+
+    await client.get(url)
+    await client.get(url)
+
+    assert client.client.get.await_count == 2
+    assert client.client.get.await_args.kwargs["headers"] is None
+
+
+@pytest.mark.asyncio
+async def test_get_content_type_uses_head_once(client) -> None:
+    client.client.head.return_value = make_response(200, {"content-type": "Application/PDF"})
+    url = "https://codeforces.com/contest/1/attachments/download/1"
+
+    assert await client.get_content_type(url) == "application/pdf"
+    assert await client.get_content_type(url) == "application/pdf"
+
+    assert client.client.head.await_count == 1
+    client.client.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_content_type_falls_back_to_ranged_get(client) -> None:
+    client.client.head.return_value = make_response(405)
+    ranged = make_response(206, {"content-type": "text/html"})
+    ranged.aclose = AsyncMock()
+    client.client.get.return_value = ranged
+
+    assert await client.get_content_type("https://example.com/editorial") == "text/html"
+    assert client.client.get.await_args.kwargs["headers"] == {"Range": "bytes=0-0"}
+    assert client.client.get.await_args.kwargs["stream"] is True
+    ranged.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_request(client) -> None:
+    ok = make_response(200)
+    client.client.get.return_value = ok
+    url = "https://codeforces.com/blog/entry/1"
+
+    responses = await client.get_many([url, url, url])
+
+    assert responses == [ok, ok, ok]
+    assert client.client.get.await_count == 1
+    assert not client._inflight
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "resource_type, aborted", [("image", True), ("font", True), ("document", False)]
+)
+async def test_route_resource_blocks_heavy_assets(client, resource_type, aborted) -> None:
+    route = AsyncMock(request=SimpleNamespace(resource_type=resource_type))
+
+    await client._route_resource(route)
+
+    assert route.abort.await_count == int(aborted)
+    assert route.continue_.await_count == int(not aborted)
@@ -0,0 +1,91 @@
+import pickle
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from domain.models import (
+    CachedEditorial,
+    Editorial,
+    ProblemData,
+    ProblemIdentifier,
+    TutorialFormat,
+)
+
+
+def make_cached(problem_data: ProblemData | None = None) -> CachedEditorial:
+    identifier = ProblemIdentifier(contest_id="2183", problem_id="A")
+    editorial = Editorial(
+        problem_id="A",
+        solution_text="Sort the array.",
+        source_url="https://codeforces.com/blog/entry/149944",
+    )
+    return CachedEditorial(
+        problem=identifier,
+        editorial=editorial,
+        tutorial_url="https://codeforces.com/blog/entry/149944",
+        tutorial_format=TutorialFormat.HTML,
+        problem_data=problem_data,
+    )
+
+
+def test_cached_editorial_roundtrip_with_problem_data() -> None:
+    identifier = ProblemIdentifier(contest_id="2183", problem_id="A")
+    problem_data = ProblemData(
+        identifier=identifier,
+        title="Real Problem Title",
+        url="https://codeforces.com/problemset/problem/2183/A",
+        contest_name="Hello 2026",
+        possible_editorial_links=["https://codeforces.com/blog/entry/149944"],
+    )
+    cached = make_cached(problem_data)
+
+    restored = CachedEditorial.from_dict(cached.to_dict())
+
+    assert restored == cached
+    assert restored.problem_data is not None
+    assert restored.problem_data.identifier == identifier
+
+
+def test_cached_editorial_from_dict_without_problem_data() -> None:
+    data = make_cached().to_dict()
+    del data["problem_data"]
+
+    restored = CachedEditorial.from_dict(data)
+
+    assert restored.problem_data is None
+    assert restored.editorial.solution_text == "Sort the array."
+
+
+def test_cached_editorial_from_dict_reads_iso_timestamps() -> None:
+    cached = make_cached()
+    data = cached.to_dict()
+    data["cached_at"] = cached.cached_at.isoformat()
+    data["editorial"]["extracted_at"] = cached.editorial.extracted_at.isoformat()
+
+    assert CachedEditorial.from_dict(data) == cached
+
+
+def test_cached_editorial_is_expired() -> None:
+    cached = make_cached()
+
+    assert not cached.is_expired
+    assert replace(cached, cached_at=datetime.now() - timedelta(hours=169)).is_expired
+
+
+def test_problem_identifier_hash_and_equality() -> None:
+    identifier = ProblemIdentifier(contest_id="2183", problem_id="A")
+    same = ProblemIdentifier(contest_id="2183", problem_id="A")
+    gym = ProblemIdentifier(contest_id="2183", problem_id="A", is_gym=True)
+
+    assert identifier == same and hash(identifier) == hash(same)
+    assert identifier != gym
+    assert {identifier: "cached"}[same] == "cached"
+
+
+def test_problem_identifier_pickles_without_derived_fields() -> None:
+    identifier = ProblemIdentifier(contest_id="2183", problem_id="A")
+
+    restored = pickle.loads(pickle.dumps(identifier))
+
+    assert restored == identifier
+    assert restored.cache_key == identifier.cache_key
+    assert b"_hash" not in pickle.dumps(identifier)
@@ -56,7 +56,7 @@ SAMPLE_HTML_NO_EDITORIAL = """
 @pytest.fixture
 def mock_http_client() -> AsyncMock:
     client = AsyncMock()
-    client.get_text.return_value = REALISTIC_HTML
+    client.get_bytes.return_value = REALISTIC_HTML.encode()
     return client
 
 
@@ -83,7 +83,7 @@ async def test_parse_successful(mock_http_client) -> None:
 @pytest.mark.asyncio
 async def test_parse_no_editorial() -> None:
     client = AsyncMock()
-    client.get_text.return_value = SAMPLE_HTML_NO_EDITORIAL
+    client.get_bytes.return_value = SAMPLE_HTML_NO_EDITORIAL.encode()
     identifier = ProblemIdentifier(contest_id="9999", problem_id="B", is_gym=False)
 
     parser = ProblemPageParser(client)
@@ -96,9 +96,22 @@ async def test_parse_no_editorial() -> None:
 @pytest.mark.asyncio
 async def test_http_error_handling() -> None:
     client = AsyncMock()
-    client.get_text.side_effect = Exception("Network Error")
+    client.get_bytes.side_effect = Exception("Network Error")
     identifier = ProblemIdentifier(contest_id="1234", problem_id="A")
 
     with pytest.raises(ParsingError):
         parser = ProblemPageParser(client)
         await parser.parse_problem_page(identifier=identifier)
+
+
+@pytest.mark.parametrize(
+    "href, expected",
+    [
+        ("/blog/entry/149944", "https://codeforces.com/blog/entry/149944"),
+        ("//codeforces.com/blog/entry/149944", "https://codeforces.com/blog/entry/149944"),
+        ("http://codeforces.com/blog/entry/149944", "https://codeforces.com/blog/entry/149944"),
+        ("https://codeforces.com/blog/entry/149944", "https://codeforces.com/blog/entry/149944"),
+    ],
+)
+def test_normalize_url(href, expected) -> None:
+    assert ProblemPageParser()._normalize_url(href=href) == expected
@@ -0,0 +1,70 @@
+import fakeredis
+import pytest
+
+from litestar import Litestar, get
+from litestar.datastructures import State
+from litestar.testing import AsyncTestClient
+
+from api.rate_limit import SlidingWindowRateLimitMiddleware
+from infrastructure.cache_redis import AsyncRedisCache
+
+
+@get("/ping")
+async def ping() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@get("/schema/ping")
+async def schema_ping() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+def make_app(server: fakeredis.FakeServer, limit: int = 2) -> Litestar:
+    cache = AsyncRedisCache()
+    cache.client = fakeredis.FakeAsyncRedis(server=server)
+
+    return Litestar(
+        route_handlers=[ping, schema_ping],
+        middleware=[
+            SlidingWindowRateLimitMiddleware(limit=limit, window_seconds=60, exclude=["/schema"])
+        ],
+        state=State({"cache_client": cache}),
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_over_limit_get_429() -> None:
+    async with AsyncTestClient(app=make_app(fakeredis.FakeServer())) as client:
+        first = await client.get("/ping")
+        second = await client.get("/ping")
+        denied = await client.get("/ping")
+
+    assert first.status_code == 200
+    assert first.headers["RateLimit-Limit"] == "2"
+    assert first.headers["RateLimit-Remaining"] == "1"
+    assert second.headers["RateLimit-Remaining"] == "0"
+
+    assert denied.status_code == 429
+    assert denied.headers["RateLimit-Remaining"] == "0"
+    assert 0 < int(denied.headers["Retry-After"]) <= 60
+
+
+@pytest.mark.asyncio
+async def test_excluded_paths_are_not_limited() -> None:
+    async with AsyncTestClient(app=make_app(fakeredis.FakeServer(), limit=1)) as client:
+        responses = [await client.get("/schema/ping") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert "RateLimit-Limit" not in responses[0].headers
+
+
+@pytest.mark.asyncio
+async def test_requests_allowed_when_redis_fails() -> None:
+    server = fakeredis.FakeServer()
+    server.connected = False
+
+    async with AsyncTestClient(app=make_app(server, limit=1)) as client:
+        responses = [await client.get("/ping") for _ in range(3)]
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert "RateLimit-Limit" not in responses[0].headers
@@ -0,0 +1,40 @@
+import pytest
+
+from domain.parsers.tutorial_parser import TutorialParser
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://codeforces.com/contest/2183/attachments/download/35276/solution.pdf", True),
+        ("https://example.com/files/Editorial.PDF?download=1", True),
+        ("https://codeforces.com/blog/entry/149944", False),
+        ("https://codeforces.com/contest/2183/attachments/download/35276", None),
+        ("https://example.com/editorial", None),
+    ],
+)
+def test_is_pdf_url(url, expected) -> None:
+    assert TutorialParser._is_pdf_url(url) is expected
+
+
+def test_extract_html_text_with_xml_declaration() -> None:
+    html = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        "<html><head><title>Page</title></head><body><h1>T</h1><p>hello</p></body></html>"
+    )
+
+    assert TutorialParser._extract_html_text(html) == ("T\nhello", "T")
+
+
+@pytest.mark.parametrize("html", ["", "   \n"])
+def test_extract_html_text_empty_document(html) -> None:
+    assert TutorialParser._extract_html_text(html) == ("", None)
+
+
+def test_extract_html_text_prefers_content_div() -> None:
+    html = (
+        "<html><body><h1>Editorial</h1><script>x()</script>"
+        '<div class="ttypography">Problem A<p>Use DP.</p></div></body></html>'
+    )
+
+    assert TutorialParser._extract_html_text(html) == ("Problem A\nUse DP.", "Editorial")
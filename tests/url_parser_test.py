@@ -36,6 +36,46 @@ def test_parse_invalid_urls() -> None:
             URLParser.parse(url=url)
 
 
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://codeforces.com/problemset/problem/500/A", True),
+        ("http://www.codeforces.ru/problemset/problem/1350/B1", True),
+        ("https://example.com/?next=https://codeforces.com/problemset/problem/500/A", True),
+        ("codeforces.com/problemset/problem/500/A", False),
+        ("https://codeforces.com/contest/1234/problem/C", False),
+        ("http://[::1/problemset/problem/500/A", False),
+    ],
+)
+def test_validate_url_matches_parse(url, expected) -> None:
+    assert URLParser.validate_url(url) is expected
+
+    if expected:
+        URLParser.parse(url)
+    else:
+        with pytest.raises(URLParsingError):
+            URLParser.parse(url)
+
+
+def test_parse_many_keeps_order_and_skips_invalid() -> None:
+    urls = [
+        "https://codeforces.com/problemset/problem/500/A",
+        "not_a_url",
+        "https://example.com/?next=https://codeforces.com/problemset/problem/1350/B1",
+        "https://codeforces.com/contest/1234/problem/C",
+        "http://codeforces.ru/problemset/problem/1234/C",
+    ]
+
+    assert URLParser.parse_many(urls) == [
+        ProblemIdentifier(contest_id="500", problem_id="A"),
+        None,
+        ProblemIdentifier(contest_id="1350", problem_id="B1"),
+        None,
+        ProblemIdentifier(contest_id="1234", problem_id="C"),
+    ]
+    assert URLParser.parse_many([]) == []
+
+
 def test_build_problem_url() -> None:
     contest_id = ProblemIdentifier(contest_id="1234", problem_id="A", is_gym=False)
     assert (